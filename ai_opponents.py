@@ -4,7 +4,6 @@ Students should edit student_ai_choose_move() to implement their own AI.
 """
 
 import random
-from collections import namedtuple
 
 MOVE_UP = -1
 MOVE_STAY = 0
@@ -17,7 +16,10 @@ MOVE_DOWN = 1
 #   state.window_height     - height of the game window in pixels
 #   state.paddle_height     - height of each paddle in pixels
 #   state.paddle_speed      - pixels a paddle moves per frame
+#   state.half_paddle       - paddle_height // 2
+#   state.half_window       - window_height // 2
 #   state.my_side           - "left" or "right"
+#   state.my_side_is_right  - True when my_side is "right"
 #   state.my_paddle_x       - x position of your paddle
 #   state.my_paddle_y       - y position of your paddle (top edge)
 #   state.opponent_paddle_x - x position of opponent paddle
@@ -26,12 +28,43 @@ MOVE_DOWN = 1
 #   state.ball_y            - y position of ball center
 #   state.ball_vx           - horizontal ball speed (positive = moving right)
 #   state.ball_vy           - vertical ball speed (positive = moving down)
-GameState = namedtuple("GameState", [
-    "window_width", "window_height", "paddle_height", "paddle_speed",
-    "my_side", "my_paddle_x", "my_paddle_y",
-    "opponent_paddle_x", "opponent_paddle_y",
-    "ball_x", "ball_y", "ball_vx", "ball_vy",
-])
+class GameState:
+    """Per-frame AI input. A new one is built for every paddle on every frame."""
+
+    __slots__ = (
+        "window_width", "window_height", "paddle_height", "paddle_speed",
+        "my_side", "my_paddle_x", "my_paddle_y",
+        "opponent_paddle_x", "opponent_paddle_y",
+        "ball_x", "ball_y", "ball_vx", "ball_vy",
+        "my_side_is_right", "half_paddle", "half_window",
+    )
+
+    def __init__(
+        self, window_width, window_height, paddle_height, paddle_speed,
+        my_side, my_paddle_x, my_paddle_y,
+        opponent_paddle_x, opponent_paddle_y,
+        ball_x, ball_y, ball_vx, ball_vy,
+    ):
+        self.window_width = window_width
+        self.window_height = window_height
+        self.paddle_height = paddle_height
+        self.paddle_speed = paddle_speed
+        self.my_side = my_side
+        self.my_paddle_x = my_paddle_x
+        self.my_paddle_y = my_paddle_y
+        self.opponent_paddle_x = opponent_paddle_x
+        self.opponent_paddle_y = opponent_paddle_y
+        self.ball_x = ball_x
+        self.ball_y = ball_y
+        self.ball_vx = ball_vx
+        self.ball_vy = ball_vy
+        self.my_side_is_right = my_side == "right"
+        self.half_paddle = paddle_height >> 1
+        self.half_window = window_height >> 1
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"GameState({fields})"
 
 
 # ---------------------------------------------------------------------------
@@ -39,31 +72,33 @@ GameState = namedtuple("GameState", [
 # ---------------------------------------------------------------------------
 
 def is_ball_moving_toward_me(state):
-    if state.my_side == "right":
-        return state.ball_vx > 0
-    return state.ball_vx < 0
+    return state.ball_vx > 0 if state.my_side_is_right else state.ball_vx < 0
 
 
 def reflect_y(y_value, height):
     """Reflect a y value inside [0, height] as if bouncing on top/bottom walls."""
     if height <= 0:
         return 0.0
-    period = 2 * height
-    reflected = y_value % period
-    if reflected > height:
-        reflected = period - reflected
-    return reflected
+    # Triangle wave: shifting by height turns the fold at height into abs().
+    return abs((y_value + height) % (2 * height) - height)
 
 
 def predict_intercept_y(state):
     """Estimate where the ball will cross this paddle's x coordinate."""
-    if state.ball_vx == 0:
-        return float(state.ball_y)
-    steps = (state.my_paddle_x - state.ball_x) / state.ball_vx
+    ball_y = state.ball_y
+    ball_vx = state.ball_vx
+    if ball_vx == 0:
+        return float(ball_y)
+    steps = (state.my_paddle_x - state.ball_x) / ball_vx
     if steps < 0:
-        return float(state.ball_y)
-    predicted_y = state.ball_y + state.ball_vy * steps
-    return reflect_y(predicted_y, state.window_height)
+        return float(ball_y)
+    return reflect_y(ball_y + state.ball_vy * steps, state.window_height)
+
+
+def move_toward(target_y, paddle_center, dead_zone=0):
+    """Return the move that brings paddle_center within dead_zone of target_y."""
+    # Branchless sign: True - False == MOVE_DOWN, False - True == MOVE_UP.
+    return (target_y > paddle_center + dead_zone) - (target_y < paddle_center - dead_zone)
 
 
 # ===== YOUR CODE: Edit the function below ===================================
@@ -95,31 +130,34 @@ def student_ai_choose_move(state):
 
 def tracking_ai_choose_move(state):
     """Baseline opponent that tracks the ball with simple rules."""
-    paddle_center = state.my_paddle_y + state.paddle_height // 2
+    paddle_center = state.my_paddle_y + state.half_paddle
     target_y = state.ball_y
 
     # When ball moves away, drift back toward center.
     if not is_ball_moving_toward_me(state):
-        target_y = state.window_height // 2
+        target_y = state.half_window
 
-    dead_zone = 8
-    if target_y < paddle_center - dead_zone:
-        return MOVE_UP
-    if target_y > paddle_center + dead_zone:
-        return MOVE_DOWN
-    return MOVE_STAY
+    return move_toward(target_y, paddle_center, dead_zone=8)
 
 
 def random_ai_choose_move(state):
     """Very weak opponent useful for first tests."""
-    return random.choice([MOVE_UP, MOVE_STAY, MOVE_DOWN])
+    return random.randrange(MOVE_UP, MOVE_DOWN + 1)
 
 
-def make_reference_ai():
+def make_reference_ai(rng=None):
     """Create a ReferenceAI function (intentionally weak baseline for benchmarking).
 
     Returns a choose_move function that keeps internal state via closure.
+    rng is an optional random.Random; by default a new one is seeded from the
+    module-level generator, so random.seed() still makes benchmarks repeatable.
     """
+    if rng is None:
+        rng = random.Random(random.getrandbits(64))
+    rand = rng.random
+    randrange = rng.randrange
+    randint = rng.randint
+
     hold_frames = 0
     last_move = MOVE_STAY
 
@@ -131,28 +169,22 @@ def make_reference_ai():
             hold_frames -= 1
             return last_move
 
-        paddle_center = state.my_paddle_y + state.paddle_height // 2
+        paddle_center = state.my_paddle_y + state.half_paddle
 
         if is_ball_moving_toward_me(state):
             # Track current ball position instead of predicted intercept.
             target_y = state.ball_y
         else:
             # Slowly drift to center when ball is moving away.
-            target_y = state.window_height // 2
+            target_y = state.half_window
 
-        dead_zone = 24
-        if target_y < paddle_center - dead_zone:
-            last_move = MOVE_UP
-        elif target_y > paddle_center + dead_zone:
-            last_move = MOVE_DOWN
-        else:
-            last_move = MOVE_STAY
+        last_move = move_toward(target_y, paddle_center, dead_zone=24)
 
         # Periodic mistakes make this AI less consistent.
-        if random.random() < 0.18:
-            last_move = random.choice([MOVE_UP, MOVE_STAY, MOVE_DOWN])
+        if rand() < 0.18:
+            last_move = randrange(MOVE_UP, MOVE_DOWN + 1)
 
-        hold_frames = random.randint(2, 4)
+        hold_frames = randint(2, 4)
         return last_move
 
     return choose_move
@@ -160,22 +192,22 @@ def make_reference_ai():
 
 def normalize_move(move):
     """Coerce any integer move into -1, 0, or 1."""
-    if move < 0:
-        return MOVE_UP
-    if move > 0:
-        return MOVE_DOWN
-    return MOVE_STAY
+    return (move > 0) - (move < 0)
+
+
+# Maps each AI name to (factory returning a choose_move function, display name).
+AI_REGISTRY = {
+    "tracking": (lambda: tracking_ai_choose_move, "TrackingAI"),
+    "reference": (make_reference_ai, "ReferenceAI"),
+    "random": (lambda: random_ai_choose_move, "RandomAI"),
+    "student": (lambda: student_ai_choose_move, "StudentAI"),
+}
 
 
 def create_ai(name):
     """Return (choose_move_function, display_name) for the given AI name."""
-    key = name.strip().lower()
-    if key == "tracking":
-        return tracking_ai_choose_move, "TrackingAI"
-    if key == "reference":
-        return make_reference_ai(), "ReferenceAI"
-    if key == "random":
-        return random_ai_choose_move, "RandomAI"
-    if key == "student":
-        return student_ai_choose_move, "StudentAI"
-    raise ValueError("Unknown AI. Choose from: tracking, reference, random, student")
+    try:
+        factory, display_name = AI_REGISTRY[name.strip().lower()]
+    except KeyError:
+        raise ValueError("Unknown AI. Choose from: " + ", ".join(AI_REGISTRY)) from None
+    return factory(), display_name
@@ -5,26 +5,21 @@ Controls:
 - Right paddle (PVP mode only): Up arrow, Down arrow
 """
 
+from __future__ import annotations
+
 import argparse
 import os
 import random
 import warnings
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import TYPE_CHECKING
 
-from ai_opponents import GameState, create_ai, normalize_move
-
-# Hide the pygame startup banner in terminal output.
-os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+from ai_opponents import AI_REGISTRY, GameState, create_ai, normalize_move
 
-# pygame 2.6 imports pkg_resources internally, which triggers a deprecation
-# warning on newer setuptools versions. Suppress that single warning.
-warnings.filterwarnings(
-    "ignore",
-    message=r"pkg_resources is deprecated as an API.*",
-    category=UserWarning,
-    module=r"pygame\.pkgdata",
-)
-
-import pygame
+if TYPE_CHECKING:
+    import pygame
 
 # Window and game settings
 WIDTH = 800
@@ -48,7 +43,116 @@ BALL_MAX_Y_SPEED = 7
 # Colors (R, G, B)
 BLACK = (20, 20, 20)
 WHITE = (245, 245, 245)
-AI_CHOICES = ["tracking", "reference", "random", "student"]
+AI_CHOICES = list(AI_REGISTRY)
+
+
+def import_pygame() -> None:
+    """Import pygame on first use so headless benchmark runs never load SDL."""
+    global pygame
+
+    # Hide the pygame startup banner in terminal output.
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    # pygame 2.6 imports pkg_resources internally, which triggers a deprecation
+    # warning on newer setuptools versions. Suppress that single warning.
+    warnings.filterwarnings(
+        "ignore",
+        message=r"pkg_resources is deprecated as an API.*",
+        category=UserWarning,
+        module=r"pygame\.pkgdata",
+    )
+
+    import pygame
+
+
+class Rect:
+    """Minimal pygame.Rect stand-in for headless matches.
+
+    Provides only what the physics code uses, so pygame.Rect can be passed
+    anywhere a Rect is expected.
+    """
+
+    __slots__ = ("x", "y", "w", "h")
+
+    def __init__(self, x: int, y: int, w: int, h: int) -> None:
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+
+    @property
+    def left(self) -> int:
+        return self.x
+
+    @left.setter
+    def left(self, value: int) -> None:
+        self.x = value
+
+    @property
+    def right(self) -> int:
+        return self.x + self.w
+
+    @right.setter
+    def right(self, value: int) -> None:
+        self.x = value - self.w
+
+    @property
+    def top(self) -> int:
+        return self.y
+
+    @top.setter
+    def top(self, value: int) -> None:
+        self.y = value
+
+    @property
+    def bottom(self) -> int:
+        return self.y + self.h
+
+    @bottom.setter
+    def bottom(self, value: int) -> None:
+        self.y = value - self.h
+
+    @property
+    def centerx(self) -> int:
+        return self.x + self.w // 2
+
+    @centerx.setter
+    def centerx(self, value: int) -> None:
+        self.x = value - self.w // 2
+
+    @property
+    def centery(self) -> int:
+        return self.y + self.h // 2
+
+    @centery.setter
+    def centery(self, value: int) -> None:
+        self.y = value - self.h // 2
+
+    @property
+    def center(self) -> tuple[int, int]:
+        return self.centerx, self.centery
+
+    @center.setter
+    def center(self, value: tuple[int, int]) -> None:
+        self.centerx, self.centery = value
+
+
+class MatchState:
+    """Mutable state of one match: paddles, ball, ball velocity, and score.
+
+    update_ball() changes it in place instead of returning new values.
+    """
+
+    __slots__ = ("left_paddle", "right_paddle", "ball_rect", "vx", "vy", "left_score", "right_score")
+
+    def __init__(self, left_paddle: Rect, right_paddle: Rect, ball_rect: Rect, vx: int, vy: int) -> None:
+        self.left_paddle = left_paddle
+        self.right_paddle = right_paddle
+        self.ball_rect = ball_rect
+        self.vx = vx
+        self.vy = vy
+        self.left_score = 0
+        self.right_score = 0
 
 
 def parse_args() -> argparse.Namespace:
@@ -106,10 +210,22 @@ def parse_args() -> argparse.Namespace:
         default=2026,
         help="Base random seed for benchmark mode",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for benchmark mode "
+            "(1 = run matches in this process, 0 = one per available CPU core)"
+        ),
+    )
+    args = parser.parse_args()
+    if args.workers < 0:
+        parser.error("--workers must be 0 or a positive number")
+    return args
 
 
-def clamp_paddle(paddle_rect: pygame.Rect) -> None:
+def clamp_paddle(paddle_rect: Rect) -> None:
     """Keep a paddle inside the window."""
     if paddle_rect.top < 0:
         paddle_rect.top = 0
@@ -117,13 +233,13 @@ def clamp_paddle(paddle_rect: pygame.Rect) -> None:
         paddle_rect.bottom = HEIGHT
 
 
-def reset_ball(ball_rect: pygame.Rect) -> tuple[int, int]:
+def reset_ball(ball_rect: Rect) -> tuple[int, int]:
     """Move ball to center and return a fresh velocity."""
     ball_rect.center = (WIDTH // 2, HEIGHT // 2)
-    x_direction = random.choice([-1, 1])
-    y_direction = random.choice([-1, 1])
-    vx = BALL_START_SPEED * x_direction
-    vy = BALL_START_SPEED * y_direction
+    # One 2-bit draw picks both directions: bit 0 for x, bit 1 for y.
+    bits = random.getrandbits(2)
+    vx = BALL_START_SPEED * (1 - ((bits & 1) << 1))
+    vy = BALL_START_SPEED * (1 - (bits & 2))
     return vx, vy
 
 
@@ -155,137 +271,188 @@ def move_left_paddle(keys: pygame.key.ScancodeWrapper, left_paddle: pygame.Rect)
     clamp_paddle(left_paddle)
 
 
-def move_right_paddle_with_ai(right_paddle: pygame.Rect, ai_move: int) -> None:
+def move_right_paddle_with_ai(right_paddle: Rect, ai_move: int) -> None:
     """Apply AI move to the right paddle.
 
-    ai_move values:
+    ai_move values (already passed through normalize_move):
     -1 = up, 0 = stay, 1 = down
     """
-    right_paddle.y += normalize_move(ai_move) * PADDLE_SPEED
+    right_paddle.y += ai_move * PADDLE_SPEED
     clamp_paddle(right_paddle)
 
 
-def move_left_paddle_with_ai(left_paddle: pygame.Rect, ai_move: int) -> None:
-    """Apply AI move to the left paddle."""
-    left_paddle.y += normalize_move(ai_move) * PADDLE_SPEED
-    clamp_paddle(left_paddle)
+def move_paddles_with_ai(left_paddle: Rect, right_paddle: Rect, left_move: int, right_move: int) -> None:
+    """Apply already normalized AI moves to both paddles.
+
+    Moving and clamping are fused into one write per paddle; the result is the
+    same as moving the paddle and then calling clamp_paddle().
+    """
+    speed = PADDLE_SPEED
+    lowest_y = HEIGHT - PADDLE_HEIGHT
+    left_y = left_paddle.y + left_move * speed
+    right_y = right_paddle.y + right_move * speed
+    left_paddle.y = 0 if left_y < 0 else lowest_y if left_y > lowest_y else left_y
+    right_paddle.y = 0 if right_y < 0 else lowest_y if right_y > lowest_y else right_y
 
 
 def build_ai_state(
     side: str,
-    my_paddle: pygame.Rect,
-    opponent_paddle: pygame.Rect,
-    ball_rect: pygame.Rect,
+    my_paddle: Rect,
+    opponent_paddle: Rect,
+    ball_rect: Rect,
     ball_vx: int,
     ball_vy: int,
 ) -> GameState:
-    """Create the state object passed to an AI controller."""
-    if side not in {"left", "right"}:
-        raise ValueError("side must be 'left' or 'right'")
+    """Create the state object passed to an AI controller.
 
+    side must be "left" or "right"; callers pass literals, so it is not
+    re-validated on every frame.
+    """
+    # Positional in GameState field order, avoiding a kwargs dict per call.
     return GameState(
-        window_width=WIDTH,
-        window_height=HEIGHT,
-        paddle_height=PADDLE_HEIGHT,
-        paddle_speed=PADDLE_SPEED,
-        my_side=side,
-        my_paddle_x=my_paddle.x,
-        my_paddle_y=my_paddle.y,
-        opponent_paddle_x=opponent_paddle.x,
-        opponent_paddle_y=opponent_paddle.y,
-        ball_x=ball_rect.centerx,
-        ball_y=ball_rect.centery,
-        ball_vx=ball_vx,
-        ball_vy=ball_vy,
+        WIDTH, HEIGHT, PADDLE_HEIGHT, PADDLE_SPEED,
+        side, my_paddle.x, my_paddle.y,
+        opponent_paddle.x, opponent_paddle.y,
+        ball_rect.centerx, ball_rect.centery, ball_vx, ball_vy,
     )
 
 
-def bounce_off_paddle(ball_rect: pygame.Rect, paddle_rect: pygame.Rect, vx: int, vy: int) -> tuple[int, int]:
+def bounce_off_paddle(ball_rect: Rect, paddle_rect: Rect, vx: int, vy: int) -> tuple[int, int]:
     """Bounce ball from a paddle and adjust vertical speed based on hit location."""
     # Flip horizontal direction.
     vx = -vx
 
     # Hitting near paddle edges changes Y speed more than center hits.
     relative_hit = (ball_rect.centery - paddle_rect.centery) / (PADDLE_HEIGHT / 2)
-    vy += int(relative_hit * 3)
 
     # Keep Y speed in a useful range.
-    if vy > BALL_MAX_Y_SPEED:
-        vy = BALL_MAX_Y_SPEED
-    if vy < -BALL_MAX_Y_SPEED:
-        vy = -BALL_MAX_Y_SPEED
+    max_y_speed = BALL_MAX_Y_SPEED
+    vy = max(-max_y_speed, min(max_y_speed, vy + int(relative_hit * 3)))
 
     return vx, vy
 
 
-def update_ball(
-    ball_rect: pygame.Rect,
-    left_paddle: pygame.Rect,
-    right_paddle: pygame.Rect,
-    vx: int,
-    vy: int,
-    left_score: int,
-    right_score: int,
-) -> tuple[int, int, int, int]:
-    """Move ball, handle collisions, and update score."""
-    ball_rect.x += vx
-    ball_rect.y += vy
+def update_ball(match: MatchState) -> bool:
+    """Move ball, handle collisions, and update score in place.
+
+    Returns True if a point was scored this frame.
+    """
+    # Constants read more than once below, bound once as fast locals.
+    ball_size = BALL_SIZE
+    paddle_width = PADDLE_WIDTH
+
+    ball_rect = match.ball_rect
+    vx = match.vx
+    vy = match.vy
+
+    ball_x = ball_rect.x + vx
+    ball_y = ball_rect.y + vy
+    ball_rect.x = ball_x
+    ball_rect.y = ball_y
 
     # Bounce off top/bottom walls.
-    if ball_rect.top <= 0 or ball_rect.bottom >= HEIGHT:
+    if ball_y <= 0 or ball_y + ball_size >= HEIGHT:
         vy = -vy
 
-    # Paddle collisions.
-    if ball_rect.colliderect(left_paddle) and vx < 0:
-        ball_rect.left = left_paddle.right
-        vx, vy = bounce_off_paddle(ball_rect, left_paddle, vx, vy)
-    elif ball_rect.colliderect(right_paddle) and vx > 0:
-        ball_rect.right = right_paddle.left
-        vx, vy = bounce_off_paddle(ball_rect, right_paddle, vx, vy)
+    # Paddle collisions: only the paddle the ball moves toward can be hit.
+    # Inline overlap test, equivalent to Rect.colliderect for these sizes.
+    paddle = match.left_paddle if vx < 0 else match.right_paddle
+    paddle_x = paddle.x
+    paddle_y = paddle.y
+    if (
+        ball_x < paddle_x + paddle_width
+        and ball_x + ball_size > paddle_x
+        and ball_y < paddle_y + PADDLE_HEIGHT
+        and ball_y + ball_size > paddle_y
+    ):
+        ball_rect.x = paddle_x + paddle_width if vx < 0 else paddle_x - ball_size
+        vx, vy = bounce_off_paddle(ball_rect, paddle, vx, vy)
 
     # Scoring.
+    scored = True
     if ball_rect.left <= 0:
-        right_score += 1
+        match.right_score += 1
         vx, vy = reset_ball(ball_rect)
     elif ball_rect.right >= WIDTH:
-        left_score += 1
+        match.left_score += 1
         vx, vy = reset_ball(ball_rect)
+    else:
+        scored = False
 
-    return vx, vy, left_score, right_score
+    match.vx = vx
+    match.vy = vy
+    return scored
+
+
+def render_score(
+    font: pygame.font.Font,
+    cache: dict[tuple[int, int], pygame.Surface],
+    left_score: int,
+    right_score: int,
+) -> pygame.Surface:
+    """Return the score text surface, rendering each distinct score only once.
+
+    Cached surfaces are converted to the display format so blits skip the
+    per-pixel format conversion.
+    """
+    key = (left_score, right_score)
+    surface = cache.get(key)
+    if surface is None:
+        surface = font.render(f"{left_score} : {right_score}", True, WHITE).convert_alpha()
+        cache[key] = surface
+    return surface
+
+
+def create_background() -> pygame.Surface:
+    """Build the static playfield (fill and center line) once per session."""
+    background = pygame.Surface((WIDTH, HEIGHT)).convert()
+    background.fill(BLACK)
+    pygame.draw.line(background, WHITE, (WIDTH // 2, 0), (WIDTH // 2, HEIGHT), 2)
+    return background
 
 
 def draw_scene(
     screen: pygame.Surface,
-    font: pygame.font.Font,
-    small_font: pygame.font.Font,
+    background: pygame.Surface,
     left_paddle: pygame.Rect,
     right_paddle: pygame.Rect,
     ball_rect: pygame.Rect,
-    left_score: int,
-    right_score: int,
-    status_text: str = "",
-) -> None:
-    """Draw all visible game elements."""
-    screen.fill(BLACK)
-
-    # Center line
-    pygame.draw.line(screen, WHITE, (WIDTH // 2, 0), (WIDTH // 2, HEIGHT), 2)
+    score_text: pygame.Surface,
+    status_text: pygame.Surface | None = None,
+    previous_rects: list[pygame.Rect] | None = None,
+) -> list[pygame.Rect]:
+    """Draw all visible game elements and return the screen areas drawn.
+
+    background comes from create_background(); score_text and status_text are
+    pre-rendered surfaces (see render_score). Pass the list returned for the
+    previous frame as previous_rects to restore and update only those areas
+    plus the new ones. None repaints the window.
+    """
+    if previous_rects is None:
+        screen.blit(background, (0, 0))
+    else:
+        for rect in previous_rects:
+            screen.blit(background, rect, rect)
 
     # Paddles and ball
-    pygame.draw.rect(screen, WHITE, left_paddle)
-    pygame.draw.rect(screen, WHITE, right_paddle)
-    pygame.draw.rect(screen, WHITE, ball_rect)
+    drawn_rects = [
+        pygame.draw.rect(screen, WHITE, left_paddle),
+        pygame.draw.rect(screen, WHITE, right_paddle),
+        pygame.draw.rect(screen, WHITE, ball_rect),
+    ]
 
     # Score text
-    score_text = font.render(f"{left_score} : {right_score}", True, WHITE)
     score_rect = score_text.get_rect(center=(WIDTH // 2, 35))
-    screen.blit(score_text, score_rect)
+    drawn_rects.append(screen.blit(score_text, score_rect))
 
-    if status_text:
-        mode_text = small_font.render(status_text, True, WHITE)
-        screen.blit(mode_text, (16, 12))
+    if status_text is not None:
+        drawn_rects.append(screen.blit(status_text, (16, 12)))
 
-    pygame.display.flip()
+    if previous_rects is None:
+        pygame.display.flip()
+    else:
+        pygame.display.update(previous_rects + drawn_rects)
+    return drawn_rects
 
 
 def show_message(screen: pygame.Surface, font: pygame.font.Font, text: str, milliseconds: int = 1800) -> None:
@@ -298,70 +465,88 @@ def show_message(screen: pygame.Surface, font: pygame.font.Font, text: str, mill
     pygame.time.wait(milliseconds)
 
 
-def create_match_objects() -> tuple[pygame.Rect, pygame.Rect, pygame.Rect, int, int]:
-    """Create paddles, ball, and initial ball velocity."""
-    left_paddle = pygame.Rect(30, HEIGHT // 2 - PADDLE_HEIGHT // 2, PADDLE_WIDTH, PADDLE_HEIGHT)
-    right_paddle = pygame.Rect(
+def create_match_objects(rect_type: type = Rect) -> MatchState:
+    """Create a match with centered paddles, a served ball, and a 0-0 score.
+
+    Interactive mode passes pygame.Rect so the objects can be drawn directly.
+    """
+    left_paddle = rect_type(30, HEIGHT // 2 - PADDLE_HEIGHT // 2, PADDLE_WIDTH, PADDLE_HEIGHT)
+    right_paddle = rect_type(
         WIDTH - 30 - PADDLE_WIDTH,
         HEIGHT // 2 - PADDLE_HEIGHT // 2,
         PADDLE_WIDTH,
         PADDLE_HEIGHT,
     )
-    ball_rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+    ball_rect = rect_type(0, 0, BALL_SIZE, BALL_SIZE)
     vx, vy = reset_ball(ball_rect)
-    return left_paddle, right_paddle, ball_rect, vx, vy
+    return MatchState(left_paddle, right_paddle, ball_rect, vx, vy)
 
 
-def run_single_ai_match(left_ai_key: str, right_ai_key: str, max_frames: int) -> tuple[str, int, int, str]:
+def run_single_ai_match(
+    left_ai_fn: Callable[[GameState], int],
+    right_ai_fn: Callable[[GameState], int],
+    max_frames: int,
+) -> tuple[str, int, int, str]:
     """Run one headless AI-vs-AI match and return winner and score.
 
+    The AI functions come from create_ai(); stateful ones such as ReferenceAI
+    should be created fresh for each match.
+
     winner: "left", "right", or "draw"
     reason: "score", "frame_limit", "left_ai_error", "right_ai_error"
     """
-    left_ai_fn, _ = create_ai(left_ai_key)
-    right_ai_fn, _ = create_ai(right_ai_key)
-    left_paddle, right_paddle, ball_rect, vx, vy = create_match_objects()
-
-    left_score = 0
-    right_score = 0
+    match = create_match_objects()
+    left_paddle = match.left_paddle
+    right_paddle = match.right_paddle
+    ball_rect = match.ball_rect
     frame_count = 0
 
-    while left_score < WIN_SCORE and right_score < WIN_SCORE and frame_count < max_frames:
+    # Loop-invariant globals, bound once as fast locals for the frame loop.
+    win_score = WIN_SCORE
+    max_x_speed = BENCHMARK_MAX_BALL_X_SPEED
+    max_y_speed = BENCHMARK_MAX_BALL_Y_SPEED
+
+    while match.left_score < win_score and match.right_score < win_score and frame_count < max_frames:
+        vx = match.vx
+        vy = match.vy
         left_state = build_ai_state("left", left_paddle, right_paddle, ball_rect, vx, vy)
         right_state = build_ai_state("right", right_paddle, left_paddle, ball_rect, vx, vy)
 
+        # normalize_move() is inlined here to keep the headless frame loop
+        # free of extra Python calls.
         try:
-            left_move = normalize_move(left_ai_fn(left_state))
+            left_move = left_ai_fn(left_state)
+            left_move = (left_move > 0) - (left_move < 0)
         except Exception:
-            return "right", left_score, right_score, "left_ai_error"
+            return "right", match.left_score, match.right_score, "left_ai_error"
 
         try:
-            right_move = normalize_move(right_ai_fn(right_state))
+            right_move = right_ai_fn(right_state)
+            right_move = (right_move > 0) - (right_move < 0)
         except Exception:
-            return "left", left_score, right_score, "right_ai_error"
+            return "left", match.left_score, match.right_score, "right_ai_error"
 
-        move_left_paddle_with_ai(left_paddle, left_move)
-        move_right_paddle_with_ai(right_paddle, right_move)
+        move_paddles_with_ai(left_paddle, right_paddle, left_move, right_move)
 
-        prev_left_score = left_score
-        prev_right_score = right_score
-        prev_vx = vx
-
-        vx, vy, left_score, right_score = update_ball(
-            ball_rect, left_paddle, right_paddle, vx, vy, left_score, right_score
-        )
+        scored = update_ball(match)
 
         # Benchmark-only rally acceleration to avoid endless 0-0 loops.
-        scored = left_score != prev_left_score or right_score != prev_right_score
-        paddle_hit = not scored and prev_vx * vx < 0
+        # vx still holds the pre-update velocity here.
+        paddle_hit = not scored and vx * match.vx < 0
         if paddle_hit:
-            if abs(vx) < BENCHMARK_MAX_BALL_X_SPEED:
-                vx += 1 if vx > 0 else -1
-            if vy != 0 and abs(vy) < BENCHMARK_MAX_BALL_Y_SPEED:
-                vy += 1 if vy > 0 else -1
+            vx = match.vx
+            vy = match.vy
+            # Speed up by one in the current direction; (v > 0) - (v < 0) is
+            # the sign of v, so a flat vy == 0 stays flat.
+            if -max_x_speed < vx < max_x_speed:
+                match.vx = vx + (vx > 0) - (vx < 0)
+            if -max_y_speed < vy < max_y_speed:
+                match.vy = vy + (vy > 0) - (vy < 0)
 
         frame_count += 1
 
+    left_score = match.left_score
+    right_score = match.right_score
     if left_score > right_score:
         return "left", left_score, right_score, "score"
     if right_score > left_score:
@@ -369,22 +554,65 @@ def run_single_ai_match(left_ai_key: str, right_ai_key: str, max_frames: int) ->
     return "draw", left_score, right_score, "frame_limit"
 
 
+def run_seeded_ai_match(
+    seed: int, left_ai_key: str, right_ai_key: str, max_frames: int
+) -> tuple[str, int, int, str]:
+    """Seed the shared RNG, create both AIs, then run one headless match.
+
+    Takes AI names rather than functions so benchmark worker processes can
+    call it. The AIs are created after seeding because ReferenceAI seeds its
+    own RNG from the shared one.
+    """
+    random.seed(seed)
+    left_ai_fn, _ = create_ai(left_ai_key)
+    right_ai_fn, _ = create_ai(right_ai_key)
+    return run_single_ai_match(left_ai_fn, right_ai_fn, max_frames)
+
+
+def iter_benchmark_matches(
+    seeds: Sequence[int], max_frames: int, workers: int
+) -> Iterator[tuple[str, int, int, str]]:
+    """Yield ReferenceAI-vs-StudentAI results in seed order.
+
+    With workers > 1 the matches run in a process pool. Each one is seeded
+    inside its worker, so results match a serial run as long as the AIs keep
+    no module-level state between calls; a stateful AI sees a different
+    sequence of matches in each worker.
+    """
+    if workers <= 1:
+        for seed in seeds:
+            yield run_seeded_ai_match(seed, "reference", "student", max_frames)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            run_seeded_ai_match, seeds, repeat("reference"), repeat("student"), repeat(max_frames)
+        )
+
+
+def available_cpu_count() -> int:
+    """Return the CPUs this process may run on, respecting affinity limits."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
 def run_benchmark(args: argparse.Namespace) -> int:
     """Benchmark StudentAI against ReferenceAI and print pass/fail."""
     matches = max(1, args.matches)
     max_frames = max(60, args.max_match_frames)
     pass_win_rate = min(max(args.pass_win_rate, 0.0), 1.0)
     minimum_decisive = max(5, matches // 4)
+    workers = min(args.workers if args.workers > 0 else available_cpu_count(), matches)
+    seeds = [args.seed + match_index for match_index in range(matches)]
 
     student_wins = 0
     reference_wins = 0
     draws = 0
     student_errors = 0
 
-    for match_index in range(matches):
-        random.seed(args.seed + match_index)
-        winner, left_score, right_score, reason = run_single_ai_match("reference", "student", max_frames)
-
+    results = iter_benchmark_matches(seeds, max_frames, workers)
+    for match_index, (winner, left_score, right_score, reason) in enumerate(results):
         if winner == "right":
             student_wins += 1
         elif winner == "left":
@@ -425,18 +653,28 @@ def run_benchmark(args: argparse.Namespace) -> int:
 
 
 def run_interactive_mode(args: argparse.Namespace) -> None:
+    import_pygame()
     pygame.init()
     pygame.display.set_caption("Simple Pong")
 
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
     clock = pygame.time.Clock()
+
+    # The game only reacts to window close, Esc and expose (which forces a full
+    # repaint), and reads paddle keys with get_pressed(), so let SDL drop every
+    # other event type before it is queued.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+    )
+
     font = pygame.font.SysFont("consolas", 40)
     small_font = pygame.font.SysFont("consolas", 22)
 
-    left_paddle, right_paddle, ball_rect, vx, vy = create_match_objects()
-
-    left_score = 0
-    right_score = 0
+    match = create_match_objects(pygame.Rect)
+    left_paddle = match.left_paddle
+    right_paddle = match.right_paddle
+    ball_rect = match.ball_rect
     running = True
 
     left_ai_fn = None
@@ -458,7 +696,13 @@ def run_interactive_mode(args: argparse.Namespace) -> None:
         right_ai_fn, right_ai_name = create_ai(args.right_ai)
         status_text = f"Mode: {left_ai_name} vs {right_ai_name}"
 
+    background = create_background()
+    status_surface = small_font.render(status_text, True, WHITE).convert_alpha()
+    score_surfaces: dict[tuple[int, int], pygame.Surface] = {}
+
     show_message(screen, font, "Pong - First to 7")
+    # Screen areas drawn last frame; None forces a full repaint.
+    dirty_rects = None
 
     while running:
         for event in pygame.event.get():
@@ -466,52 +710,54 @@ def run_interactive_mode(args: argparse.Namespace) -> None:
                 running = False
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 running = False
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # Part of the window was uncovered or restored; partial
+                # updates would leave it stale, so repaint everything.
+                dirty_rects = None
 
         keys = pygame.key.get_pressed()
         if args.mode == "pvp":
             move_paddles(keys, left_paddle, right_paddle)
         elif args.mode in {"human-vs-ai", "human-vs-student"}:
             move_left_paddle(keys, left_paddle)
-            right_state = build_ai_state("right", right_paddle, left_paddle, ball_rect, vx, vy)
+            right_state = build_ai_state("right", right_paddle, left_paddle, ball_rect, match.vx, match.vy)
             right_move = normalize_move(right_ai_fn(right_state))
             move_right_paddle_with_ai(right_paddle, right_move)
         elif args.mode == "ai-vs-ai":
-            left_state = build_ai_state("left", left_paddle, right_paddle, ball_rect, vx, vy)
-            right_state = build_ai_state("right", right_paddle, left_paddle, ball_rect, vx, vy)
+            left_state = build_ai_state("left", left_paddle, right_paddle, ball_rect, match.vx, match.vy)
+            right_state = build_ai_state("right", right_paddle, left_paddle, ball_rect, match.vx, match.vy)
             left_move = normalize_move(left_ai_fn(left_state))
             right_move = normalize_move(right_ai_fn(right_state))
-            move_left_paddle_with_ai(left_paddle, left_move)
-            move_right_paddle_with_ai(right_paddle, right_move)
+            move_paddles_with_ai(left_paddle, right_paddle, left_move, right_move)
 
-        vx, vy, left_score, right_score = update_ball(
-            ball_rect, left_paddle, right_paddle, vx, vy, left_score, right_score
-        )
-        draw_scene(
+        scored = update_ball(match)
+        dirty_rects = draw_scene(
             screen,
-            font,
-            small_font,
+            background,
             left_paddle,
             right_paddle,
             ball_rect,
-            left_score,
-            right_score,
-            status_text,
+            render_score(font, score_surfaces, match.left_score, match.right_score),
+            status_surface,
+            dirty_rects,
         )
 
-        if left_score >= WIN_SCORE or right_score >= WIN_SCORE:
+        if scored and (match.left_score >= WIN_SCORE or match.right_score >= WIN_SCORE):
+            left_won = match.left_score > match.right_score
             if args.mode == "pvp":
-                winner = "Left Player Wins!" if left_score > right_score else "Right Player Wins!"
+                winner = "Left Player Wins!" if left_won else "Right Player Wins!"
             elif args.mode in {"human-vs-ai", "human-vs-student"}:
-                winner = "You Win!" if left_score > right_score else f"{right_ai_name} Wins!"
+                winner = "You Win!" if left_won else f"{right_ai_name} Wins!"
             else:
-                winner = f"{left_ai_name} Wins!" if left_score > right_score else f"{right_ai_name} Wins!"
+                winner = f"{left_ai_name} Wins!" if left_won else f"{right_ai_name} Wins!"
             show_message(screen, font, winner)
-            left_score = 0
-            right_score = 0
+            match.left_score = 0
+            match.right_score = 0
             left_paddle.centery = HEIGHT // 2
             right_paddle.centery = HEIGHT // 2
-            vx, vy = reset_ball(ball_rect)
+            match.vx, match.vy = reset_ball(ball_rect)
             show_message(screen, font, "New Match")
+            dirty_rects = None
 
         clock.tick(FPS)
 